@@ -10,17 +10,27 @@ Date: 2025-05-16
 """
 
 import logging
+import logging.handlers
 
 from robot import Robot
 
 
+LOG_FORMAT = '[%(asctime)s - %(levelname)s - %(module)s:%(lineno)d] %(message)s'
+LOG_DATEFMT = '%Y-%m-%d %H:%M:%S'
+
+# buffer the log file writes, records are written once 1024 are collected or on an error
+file_handler = logging.FileHandler('toy_robot_simulator.log')
+file_handler.setFormatter(logging.Formatter(LOG_FORMAT, LOG_DATEFMT))
+buffered_file_handler = logging.handlers.MemoryHandler(
+    capacity=1024, flushLevel=logging.ERROR, target=file_handler)
+
 logging.basicConfig(
     level=logging.INFO,
-    format='[%(asctime)s - %(levelname)s - %(module)s:%(lineno)d] %(message)s',
-    datefmt='%Y-%m-%d %H:%M:%S',
+    format=LOG_FORMAT,
+    datefmt=LOG_DATEFMT,
     handlers=[
         logging.StreamHandler(),
-        logging.FileHandler('toy_robot_simulator.log')
+        buffered_file_handler
     ]
 )
 
@@ -47,3 +57,4 @@ if __name__ == "__main__":
             r.execute_parsed_command(verb, params)
     except KeyboardInterrupt:
         logging.info("Application stopped by user.")
+        buffered_file_handler.flush()
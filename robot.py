@@ -7,37 +7,34 @@ Email: soenke.niemann@gmail.com
 Date: 2025-05-16
 """
 
+import functools
 import logging
 import sys
-from typing import Tuple
-
-from scipy.spatial.transform import Rotation as R
-import numpy as np
+from typing import Iterable, Tuple
 
 
 logger = logging.getLogger(__name__)
 
-ROT_LEFT = R.from_euler('xyz', [0, 0, 90], degrees=True)
-ROT_RIGHT = R.from_euler('xyz', [0, 0, -90], degrees=True)
 TABLE_DIM_MAX = 4
 TABLE_DIM_MIN = 0
 
-COMMANDS_AND_ARGS = (
-    ("PLACE", (int, int, str)),
-    ("MOVE", ()),
-    ("LEFT", ()),
-    ("RIGHT", ()),
-    ("REPORT", ()),
-    ("HELP", ()),
-    ("EXIT", ()),
-)
-
 DIRVECTOR_FROM_COMPASS_DIRECTION = {
-    "NORTH" : np.array([0,1,0]),
-    "SOUTH" : np.array([0,-1,0]),
-    "WEST" : np.array([-1,0,0]),
-    "EAST" : np.array([1,0,0])
+    "NORTH" : (0,1),
+    "SOUTH" : (0,-1),
+    "WEST" : (-1,0),
+    "EAST" : (1,0)
+}
+COMPASS_FROM_DIRVEC = {
+    dirvec: direction for direction, dirvec in DIRVECTOR_FROM_COMPASS_DIRECTION.items()}
+
+# heading after a 90 degree turn, keyed by the current heading (dx,dy)
+LEFT_TURN = {
+    (0,1) : (-1,0),
+    (-1,0) : (0,-1),
+    (0,-1) : (1,0),
+    (1,0) : (0,1)
 }
+RIGHT_TURN = {after: before for before, after in LEFT_TURN.items()}
 
 MAPCHAR_FROM_COMPASS_DIRECTION = {
     "NORTH" : "^",
@@ -46,64 +43,172 @@ MAPCHAR_FROM_COMPASS_DIRECTION = {
     "EAST" : ">"
 }
 
-def get_compass_direction_from_dirvec(dirvec: np.ndarray) -> str:
+
+def valid_direction(compass_direction: str) -> str:
+    """Parameter type for compass directions, so that PLACE is validated while parsing.
+
+    Args:
+        compass_direction (str): NORTH, SOUTH, EAST or WEST
+
+    Raises:
+        ValueError: Invalid compass direction
+
+    Returns:
+        str: the unchanged compass direction
+    """
+    if compass_direction not in DIRVECTOR_FROM_COMPASS_DIRECTION:
+        raise ValueError(f"'{compass_direction}' is not a valid direction, only directions "
+                         f"{tuple(DIRVECTOR_FROM_COMPASS_DIRECTION)} are allowed")
+    return compass_direction
+
+
+# user facing type name in parser messages
+valid_direction.label = "str"
+
+
+# command verb -> (parameter types, name of the Robot method executing it)
+# only the handled commands change the robot's state, REPORT, HELP and EXIT have no handler
+# and are special-cased in execute_parsed_command
+COMMAND_TABLE = {
+    "PLACE" : ((int, int, valid_direction), "place"),
+    "MOVE" : ((), "move"),
+    "LEFT" : ((), "left"),
+    "RIGHT" : ((), "right"),
+    "REPORT" : ((), None),
+    "HELP" : ((), None),
+    "EXIT" : ((), None),
+}
+
+
+def get_compass_direction_from_dirvec(dirvec: Tuple[int, int]) -> str:
     """Obtain compass direction from a direction vector.
 
     Args:
-        dirvec (np.ndarray): a 3x1 direction vector
+        dirvec (Tuple[int, int]): a 2D direction vector (dx,dy)
 
     Returns:
         str: compass direction NORTH, SOUTH, EAST or WEST or ERROR
     """
-    if np.shape(np.array([0,0,0])) != np.shape(dirvec):
-        logger.error("Invalid shape of input array!")
+    direction = COMPASS_FROM_DIRVEC.get(dirvec)
+    if direction is None:
+        logger.error("Invalid input direction vector.")
         return "ERROR"
-    if np.isclose(dirvec, np.array([0,1,0])).all():
-        return "NORTH"
-    if np.isclose(dirvec, np.array([0,-1,0])).all():
-        return "SOUTH"
-    if np.isclose(dirvec, np.array([-1,0,0])).all():
-        return "WEST"
-    if np.isclose(dirvec, np.array([1,0,0])).all():
-        return "EAST"
-    logger.error("Invalid input direction vector.")
-    return "ERROR"
+    return direction
+
+
+@functools.lru_cache(maxsize=256)
+def parse_command(command_str: str) -> Tuple[str, tuple]:
+    """Parse a command string into its verb and casted parameters.
+
+    Parsing does not depend on the robot state, so results are cached for repeated commands.
+    The debug tracing in here therefore only happens on a cache miss, the per-call trace is
+    logged by Robot.parse_command_input.
+
+    Args:
+        command_str (str): command input from the user
+
+    Raises:
+        ValueError: Invalid command verb
+        ValueError: No Parameters given
+        ValueError: No Parameters supported
+        ValueError: Not enough paramters
+
+    Returns:
+        Tuple[str, tuple]: parsed command verb and parameter tuple
+    """
+    # command verb is first, parameters follow after a single space
+    verb, separator, params_str = command_str.partition(" ")
+    command_spec = COMMAND_TABLE.get(verb)
+
+    # fast path for the common commands without parameters
+    if command_spec is not None and not separator and not command_spec[0]:
+        return verb, ()
+
+    if command_spec is None:
+        raise ValueError(f"'{verb}' is not a valid command verb. "
+                         "Choose from the list below.")
+
+    debug_enabled = logger.isEnabledFor(logging.DEBUG)
+    valid_param_types = command_spec[0]
+    type_names = ", ".join(getattr(p_type, "label", p_type.__name__)
+                           for p_type in valid_param_types)
+    if debug_enabled:
+        logger.debug("found command verb '%s' which allows param types '(%s)'",
+                     verb, type_names)
+
+    if not separator:
+        raise ValueError(f"The verb '{verb}' can only be called with "
+                         f"{len(valid_param_types)} parameters ({type_names})")
+
+    # input has params but none supported by verb
+    if len(valid_param_types) == 0:
+        raise ValueError(f"The verb '{verb}' does not support parameters")
+
+    # the param field ends at the next space, anything after it is ignored
+    params_found = params_str.partition(" ")[0].split(",")
+
+    # check has correct amount of parameters
+    if debug_enabled:
+        logger.debug("found command params '%s'", params_found)
+    if len(params_found) != len(valid_param_types):
+        raise ValueError(f"Wrong amount of comma separated params for verb '{verb}'. "
+                         f"(Found: {len(params_found)}, allowed: {len(valid_param_types)})")
+
+    # check correct type of params
+    params_casted = tuple(p_type(p) for p_type, p in zip(valid_param_types, params_found))
+    if debug_enabled:
+        logger.debug("returning verb '%s' with parsed params '%s'", verb, params_casted)
+    return verb, params_casted
 
 
 class Robot:
     """A 2D Toy Robot that can be placed, moved and rotated on top of a tabletop.
     """
 
+    # built once when the class is defined, print_help emits it in a single log record
+    HELP_TEXT = "\n".join([
+        "",
+        "Help: valid commands are",
+        "  'PLACE X,Y,F'  places the robot onto the tabletop with coordinates X: int, Y: int ",
+        f"                 (both [{TABLE_DIM_MIN}-{TABLE_DIM_MAX}]) and orientation "
+        "F: str ('NORTH', 'SOUTH', 'EAST', 'WEST')",
+        "  'MOVE'         moves the robot by one unit in the direction it is currently facing",
+        "  'LEFT'         rotates the robot by 90 degrees to the left",
+        "  'RIGHT'        rotates the robot by 90 degrees to the right",
+        "  'REPORT'       announces X,Y, and orientation F of the robot",
+        "  'EXIT'         to close this application",
+        "  'HELP'         to print this message",
+        "  Please note that the tabletop's X-axis points EAST, the Y-axis points NORTH",
+    ])
+
+    # empty map rows indexed by y, draw_map only splices the robot's cell into its row
+    MAP_ROWS = tuple(f"{r} # " + "  " * (TABLE_DIM_MAX - TABLE_DIM_MIN + 1) + "#"
+                     for r in range(TABLE_DIM_MIN, TABLE_DIM_MAX + 1))
+
     def __init__(self) -> None:
-        self.pos = np.array([0, 0, 0])
-        self.heading_vector = np.array([0, 0, 0])
+        self.x = 0
+        self.y = 0
+        self.dx = 0
+        self.dy = 0
         self.placed = False
+        # suppresses map drawing and help messages while running a batch of commands
+        self._silent = False
+        # command verb -> bound handler method, resolved once instead of on every command
+        self._dispatch = {verb: getattr(self, handler_name)
+                          for verb, (_, handler_name) in COMMAND_TABLE.items() if handler_name}
 
 
-    def check_pos_in_bounds(self, pos: np.ndarray) -> bool:
+    def check_pos_in_bounds(self, x: int, y: int) -> bool:
         """Check if input position is in bounds of table.
 
         Args:
-            pos (np.ndarray): 3x1 ndarray (x,y,z)
-
-        Raises:
-            ValueError: x-coordinate out of bounds
-            ValueError: y-coordinate out of bounds
+            x (int): x-coordinate on the table
+            y (int): y-coordinate on the table
 
         Returns:
             bool: whether input position is valid
         """
-        try:
-            if pos[0] < TABLE_DIM_MIN or pos[0] > TABLE_DIM_MAX:
-                raise ValueError(f"X must be between inclusive {TABLE_DIM_MIN} and "
-                                 f"{TABLE_DIM_MAX}, demanded X = {pos[0]}")
-            if pos[1] < TABLE_DIM_MIN or pos[1] > TABLE_DIM_MAX:
-                raise ValueError(f"Y must be between inclusive {TABLE_DIM_MIN} and "
-                                 f"{TABLE_DIM_MAX}, demanded Y = {pos[1]}")
-        except ValueError as ve:
-            logger.error("Error: robot must be within the bounds of the tabletop: %s", ve)
-            return False
-        return True
+        return TABLE_DIM_MIN <= x <= TABLE_DIM_MAX and TABLE_DIM_MIN <= y <= TABLE_DIM_MAX
 
 
     def place(self, x: int, y: int, compass_direction: str) -> bool:
@@ -117,20 +222,21 @@ class Robot:
         Returns:
             bool: success
         """
-        place_pos = np.array([x, y, 0])
-        if not self.check_pos_in_bounds(place_pos):
+        if not self.check_pos_in_bounds(x, y):
+            logger.error("Error: robot must be within the bounds of the tabletop: X and Y must be "
+                         "between inclusive %i and %i, demanded X = %i, Y = %i",
+                         TABLE_DIM_MIN, TABLE_DIM_MAX, x, y)
             return False
 
-        try:
-            self.heading_vector = DIRVECTOR_FROM_COMPASS_DIRECTION[compass_direction]
-        except KeyError:
-            logger.error("Only directions %s are allowed", DIRVECTOR_FROM_COMPASS_DIRECTION.keys())
+        # already validated by the parser, only guards direct callers
+        if compass_direction not in DIRVECTOR_FROM_COMPASS_DIRECTION:
             return False
 
-        self.pos = place_pos
+        self.dx, self.dy = DIRVECTOR_FROM_COMPASS_DIRECTION[compass_direction]
+        self.x, self.y = x, y
         self.placed = True
-        logger.info("placed robot at X=%i, Y=%i, facing %s ([x,y,z] = %s)",
-                    x, y, compass_direction, self.heading_vector)
+        logger.info("placed robot at X=%i, Y=%i, facing %s ([dx,dy] = [%i,%i])",
+                    x, y, compass_direction, self.dx, self.dy)
         return True
 
 
@@ -143,10 +249,13 @@ class Robot:
         if not self.placed:
             logger.error("Error: please first issue a in-bounds PLACE command")
             return False
-        new_pos = self.pos + self.heading_vector
-        if not self.check_pos_in_bounds(new_pos):
+        new_x, new_y = self.x + self.dx, self.y + self.dy
+        if not self.check_pos_in_bounds(new_x, new_y):
+            logger.error("Error: robot must stay within the bounds of the tabletop, "
+                         "ignoring MOVE from X = %i, Y = %i to X = %i, Y = %i",
+                         self.x, self.y, new_x, new_y)
             return False
-        self.pos = new_pos
+        self.x, self.y = new_x, new_y
         logger.debug("executed MOVE")
         return True
 
@@ -161,8 +270,7 @@ class Robot:
             logger.error("Error: please first issue a in-bounds PLACE command")
             return False
         logger.debug("turning LEFT")
-        self.heading_vector = ROT_LEFT.apply(self.heading_vector)
-        self.heading_vector = np.round(self.heading_vector, 0)
+        self.dx, self.dy = LEFT_TURN[(self.dx, self.dy)]
         return True
 
 
@@ -176,8 +284,7 @@ class Robot:
             logger.error("Error: please first issue a in-bounds PLACE command")
             return False
         logger.debug("turning RIGHT")
-        self.heading_vector = ROT_RIGHT.apply(self.heading_vector)
-        self.heading_vector = np.round(self.heading_vector, 0)
+        self.dx, self.dy = RIGHT_TURN[(self.dx, self.dy)]
         return True
 
 
@@ -190,30 +297,19 @@ class Robot:
         if not self.placed:
             logger.error("Error: please first issue a in-bounds PLACE command")
             return "Error: please first issue a in-bounds PLACE command"
-        direction_str = get_compass_direction_from_dirvec(self.heading_vector)
-        logger.info("Current robot pose: X = %i, Y = %i, HEADING = %s / %s",
-                    self.pos[0], self.pos[1], direction_str, self.heading_vector)
+        direction_str = get_compass_direction_from_dirvec((self.dx, self.dy))
+        logger.info("Current robot pose: X = %i, Y = %i, HEADING = %s / [%i,%i]",
+                    self.x, self.y, direction_str, self.dx, self.dy)
         logger.debug("executed REPORT")
-        return f"{int(self.pos[0])},{int(self.pos[1])},{direction_str}"
+        return f"{self.x},{self.y},{direction_str}"
 
 
     def print_help(self):
         """Print a help message with valid commands.
         """
-        logger.info("")
-        logger.info("Help: valid commands are")
-        logger.info("  'PLACE X,Y,F'  places the robot onto the tabletop with coordinates "
-                    "X: int, Y: int ")
-        logger.info("                 (both [%i-%i]) and orientation "
-                    "F: str ('NORTH', 'SOUTH', 'EAST', 'WEST')", TABLE_DIM_MIN, TABLE_DIM_MAX)
-        logger.info("  'MOVE'         moves the robot by one unit in the direction it is "
-                    "currently facing")
-        logger.info("  'LEFT'         rotates the robot by 90 degrees to the left")
-        logger.info("  'RIGHT'        rotates the robot by 90 degrees to the right")
-        logger.info("  'REPORT'       announces X,Y, and orientation F of the robot")
-        logger.info("  'EXIT'         to close this application")
-        logger.info("  'HELP'         to print this message")
-        logger.info("  Please note that the tabletop's X-axis points EAST, the Y-axis points NORTH")
+        if self._silent:
+            return
+        logger.info(self.HELP_TEXT)
 
 
     def parse_command_input(self, command_str: str) -> Tuple[str, list]:
@@ -222,63 +318,18 @@ class Robot:
         Args:
             command_str (str): command input from the user
 
-        Raises:
-            ValueError: Invalid command verb
-            ValueError: No Parameters given
-            ValueError: No Parameters supported
-            ValueError: Not enough paramters
-
         Returns:
-            Tuple[str, list]: parsed command verb and parameter list
+            Tuple[str, list]: parsed command verb and parameter list, ("error", []) if invalid
         """
-        verb_params_split = command_str.split(" ")
-        input_has_params = len(verb_params_split) > 1
-        found_valid_verb = -1
         try:
-            for i, c in enumerate(COMMANDS_AND_ARGS):
-                # check that command verb is first
-                if not verb_params_split[0] == c[0]:
-                    continue
-                found_valid_verb = i
-                break
-
-            if found_valid_verb == -1:
-                raise ValueError(f"'{verb_params_split[0]}' is not a valid command verb. "
-                                 "Choose from the list below.")
-
-            verb = COMMANDS_AND_ARGS[found_valid_verb][0]
-            valid_param_types = COMMANDS_AND_ARGS[found_valid_verb][1]
-            logger.debug("found command verb '%s' which allows param types '%s'",
-                         verb, valid_param_types)
-
-            if not input_has_params:
-                if len(valid_param_types) > 0:
-                    raise ValueError(f"The verb '{verb}' can only be called with "
-                                     f"{len(valid_param_types)} parameters {valid_param_types}")
-                logger.debug("returning verb '%s' with empty param list '%s'", verb, [])
-                return verb, []
-
-            # input has params but none supported by verb
-            if len(valid_param_types) == 0:
-                raise ValueError(f"The verb '{verb}' does not support parameters")
-
-            # check has correct amount of parameters
-            params_found = verb_params_split[1].split(",")
-            logger.debug("found command params '%s'", params_found)
-            if len(params_found) != len(valid_param_types):
-                raise ValueError(f"Wrong amount of comma separated params for verb '{verb}'. "
-                                 f"(Found: {len(params_found)}, allowed: {len(valid_param_types)})")
-
-            # check correct type of params
-            params_casted = []
-            for i, p_type in enumerate(valid_param_types):
-                params_casted.append(p_type(params_found[i]))
-            logger.debug("returning verb '%s' with parsed params '%s'", verb, params_casted)
-            return verb, params_casted
-
+            verb, params = parse_command(command_str)
         except ValueError as e:
             logger.error("Invalid command '%s': %s", command_str, e)
             return "error", []
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("parsed command '%s' into verb '%s' with params '%s'",
+                         command_str, verb, params)
+        return verb, list(params)
 
     def execute_parsed_command(self, command_verb: str, params: list) -> str:
         """Execute a former parsed command with given parameters.
@@ -290,59 +341,72 @@ class Robot:
         Returns:
             str: report message
         """
-        success = None
-        match command_verb:
-            case "PLACE":
-                success = self.place(params[0], params[1], params[2])
-            case "MOVE":
-                success = self.move()
-            case "LEFT":
-                success = self.left()
-            case "RIGHT":
-                success = self.right()
-            case "REPORT":
-                success = True
-                return self.report()
-            case "EXIT":
-                logger.info("Application stopped by user.")
-                sys.exit(0)
-            case "HELP":
-                success = True
-                self.print_help()
-            case _:
-                logger.warning("Nothing to be executed")
-        if not success:
+        if command_verb == "REPORT":
+            return self.report()
+        if command_verb == "EXIT":
+            logger.info("Application stopped by user.")
+            sys.exit(0)
+
+        if command_verb == "HELP":
             self.print_help()
+            return ""
+        handler = self._dispatch.get(command_verb)
+        if handler is None:
+            logger.warning("Nothing to be executed")
+            self.print_help()
+            return ""
+
+        if not handler(*params):
+            self.print_help()
+            return ""
+        # only redraw the map when the robot state changed
         self.draw_map()
         return ""
 
     def draw_map(self):
         """Draw the current map view of the tabletop.
         """
+        if self._silent:
+            return
         logger.debug("drawing map")
-        rows = TABLE_DIM_MAX
-        cols = TABLE_DIM_MAX
-        robot_indicator_char = " "
+        rows = list(self.MAP_ROWS)
         if self.placed:
             try:
                 robot_indicator_char = MAPCHAR_FROM_COMPASS_DIRECTION[
-                    get_compass_direction_from_dirvec(self.heading_vector)]
+                    get_compass_direction_from_dirvec((self.dx, self.dy))]
             except KeyError:
                 robot_indicator_char = "O"
-            print("\n  # # # # # # #  "
-                  "Robot position with heading "
-                  "North(^), South (v), West(<), East(>)")
+            row = rows[self.y - TABLE_DIM_MIN]
+            col = len(f"{self.y} # ") + 2 * (self.x - TABLE_DIM_MIN)
+            rows[self.y - TABLE_DIM_MIN] = row[:col] + robot_indicator_char + row[col + 1:]
+            lines = ["\n  # # # # # # #  "
+                     "Robot position with heading "
+                     "North(^), South (v), West(<), East(>)"]
         else:
-            print("\n  # # # # # # #  Robot not placed yet")
-        for r in range(rows, TABLE_DIM_MIN-1, -1):
-            draw_row = f"{r} # "
-            for c in range(TABLE_DIM_MIN, cols+1):
-                if self.pos[0] == c and self.pos[1] == r:
-                    draw_row += f"{robot_indicator_char} "
-                else:
-                    draw_row += "  "
-            draw_row += "#"
-            print(draw_row)
-        print("Y # # # # # # #")
-        print("  X 0 1 2 3 4  \n")
+            lines = ["\n  # # # # # # #  Robot not placed yet"]
+        lines.extend(reversed(rows))
+        lines.append("Y # # # # # # #")
+        lines.append("  X 0 1 2 3 4  \n")
+        # single write instead of one print per line
+        sys.stdout.write("\n".join(lines) + "\n")
         logger.debug("map drawn succesfully")
+
+    def run_commands(self, commands: Iterable[str], draw: bool = False) -> str:
+        """Parse and execute a sequence of commands, e.g. from a script or a test.
+
+        Args:
+            commands (Iterable[str]): sequence of command inputs
+            draw (bool): whether to draw the map and print help messages in between
+
+        Returns:
+            str: report message of the last command
+        """
+        output = ""
+        self._silent = not draw
+        try:
+            for command_str in commands:
+                verb, params = self.parse_command_input(command_str)
+                output = self.execute_parsed_command(verb, params)
+        finally:
+            self._silent = False
+        return output
@@ -23,12 +23,7 @@ def exec_robot_commands(commands: List[str]) -> str:
     Returns:
         str: output of the robot
     """
-    r = Robot()
-    output = ""
-    for c in commands:
-        verb, params = r.parse_command_input(c)
-        output = r.execute_parsed_command(verb, params)
-    return output
+    return Robot().run_commands(commands)
 
 
 def test_example_case_a():
@@ -139,6 +134,25 @@ def test_right():
     assert output_wanted == exec_robot_commands(commands)
 
 
+def test_full_turns():
+    """Test that four turns in either direction restore the heading with integer coordinates."""
+    commands = [
+        "PLACE 2,2,NORTH",
+        "LEFT",
+        "LEFT",
+        "LEFT",
+        "LEFT",
+        "RIGHT",
+        "RIGHT",
+        "RIGHT",
+        "RIGHT",
+        "MOVE",
+        "REPORT"
+    ]
+    output_wanted = "2,3,NORTH"
+    assert output_wanted == exec_robot_commands(commands)
+
+
 def test_not_moving_out_of_bounds():
     """Test that the robot doesn't move out of bounds."""
     commands = [
@@ -213,6 +227,48 @@ def test_wrong_input_3():
     assert output_wanted == exec_robot_commands(commands)
 
 
+def test_wrong_input_4():
+    """Test that a command with an invalid compass direction is ignored."""
+    commands = [
+        "PLACE 1,2,NORHT",
+        "REPORT"
+    ]
+    output_wanted = "Error: please first issue a in-bounds PLACE command"
+    assert output_wanted == exec_robot_commands(commands)
+
+
+def test_wrong_input_5():
+    """Test that a command with two spaces between command verb and parameters is ignored."""
+    commands = [
+        "PLACE  1,2,EAST",
+        "REPORT"
+    ]
+    output_wanted = "Error: please first issue a in-bounds PLACE command"
+    assert output_wanted == exec_robot_commands(commands)
+
+
+def test_wrong_input_6():
+    """Test that a command with a space after a comma between parameters is ignored."""
+    commands = [
+        "PLACE 1, 2,EAST",
+        "REPORT"
+    ]
+    output_wanted = "Error: please first issue a in-bounds PLACE command"
+    assert output_wanted == exec_robot_commands(commands)
+
+
+def test_trailing_input_ignored():
+    """Test that input after the comma separated parameters is ignored."""
+    commands = [
+        "PLACE 1,2,EAST extra",
+        "MOVE",
+        "PLACE 3,4,WEST ",
+        "REPORT"
+    ]
+    output_wanted = "3,4,WEST"
+    assert output_wanted == exec_robot_commands(commands)
+
+
 def test_wrong_input_recovery():
     """Test that the program continues when a correct command is issued after a malformed."""
     commands = [
@@ -229,3 +285,50 @@ def test_no_input():
     commands = []
     output_wanted = ""
     assert output_wanted == exec_robot_commands(commands)
+
+
+def test_repeated_parse():
+    """Test that parsing a command repeatedly yields independent, equal results."""
+    r = Robot()
+    _, params = r.parse_command_input("PLACE 1,2,EAST")
+    params.append("garbage")
+    assert ("PLACE", [1, 2, "EAST"]) == r.parse_command_input("PLACE 1,2,EAST")
+
+
+def test_parse_invalid_direction():
+    """Test that an invalid compass direction is already rejected by the parser."""
+    r = Robot()
+    assert ("error", []) == r.parse_command_input("PLACE 1,2,NORHT")
+
+
+def test_run_commands_draw(capsys):
+    """Test that the map is only drawn during a batch of commands if requested."""
+    commands = [
+        "PLACE 1,2,EAST",
+        "MOVE"
+    ]
+    r = Robot()
+    r.run_commands(commands)
+    assert "" == capsys.readouterr().out
+    r.run_commands(commands, draw=True)
+    assert "Robot position with heading" in capsys.readouterr().out
+
+
+def test_place_invalid_direction():
+    """Test that calling place directly with an invalid compass direction fails gracefully."""
+    r = Robot()
+    assert not r.place(1, 2, "NORHT")
+    assert "Error: please first issue a in-bounds PLACE command" == r.report()
+
+
+def test_redraw_only_on_state_change(capsys):
+    """Test that the map is only redrawn after a successful PLACE, MOVE, LEFT or RIGHT."""
+    r = Robot()
+    r.run_commands(["PLACE 5,5,EAST", "MOVE", "HELP", "PLACE1,2,EAST", "REPORT"], draw=True)
+    assert "# # # # # # #" not in capsys.readouterr().out
+    r.run_commands(["PLACE 1,1,EAST"], draw=True)
+    assert 1 == capsys.readouterr().out.count("Robot position with heading")
+    r.run_commands(["MOVE", "LEFT", "RIGHT"], draw=True)
+    assert 3 == capsys.readouterr().out.count("Robot position with heading")
+    r.run_commands(["MOVE", "MOVE", "MOVE"], draw=True)
+    assert 2 == capsys.readouterr().out.count("Robot position with heading")